@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""
+_welford.pyx
+============
+
+Ahead-of-time compiled Welford recurrence used by
+`analytics.RollingStats.bulk_update` for small batches when numba is not
+wanted or available.
+
+Build in place with::
+
+    python setup.py build_ext --inplace
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple welford(const double[::1] arr, Py_ssize_t n, double mean, double m2):
+    """Fold a contiguous float64 buffer into running Welford state.
+
+    Args:
+        arr (const double[::1]): Values to ingest; read-only buffers are
+            accepted.
+        n (int): Current observation count.
+        mean (float): Current running mean.
+        m2 (float): Current sum of squared deviations.
+
+    Returns:
+        tuple: Updated ``(n, mean, m2)``.
+    """
+    cdef Py_ssize_t i
+    cdef double x, d, inv_n
+    for i in range(arr.shape[0]):
+        x = arr[i]
+        n += 1
+        # 1 / n does not depend on mean, so the division stays off the
+        # loop-carried dependency chain and overlaps with earlier steps.
+        inv_n = 1.0 / n
+        d = x - mean
+        mean += d * inv_n
+        m2 += d * (x - mean)
+    return n, mean, m2
@@ -29,9 +29,22 @@ Examples:
 
 from __future__ import annotations
 
+import array
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from math import sqrt
-from typing import Iterable, List, Optional
+from functools import lru_cache, reduce, wraps
+from itertools import islice
+from math import fsum, sqrt
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:  # optional AOT-compiled Welford kernel (see setup.py / _welford.pyx)
+    from _welford import welford as _c_welford
+except ImportError:  # pragma: no cover - extension is built on demand
+    _c_welford = None
 
 
 class AnalyticsError(Exception):
@@ -42,7 +55,137 @@ class ValidationError(AnalyticsError):
     """Raised when inputs fail validation."""
 
 
-@dataclass
+def _as_float_array(values: Iterable[float]) -> Optional[np.ndarray]:
+    """Internal: convert a sized batch of numbers to a flat float64 array.
+
+    NumPy arrays of any shape are flattened; other inputs must be flat.
+
+    Returns:
+        Optional[np.ndarray]: The converted array, or None if NumPy can only
+        represent ``values`` as an object array (e.g. sets, dict views or
+        ints beyond int64). Callers then fall back to per-element updates.
+
+    Raises:
+        ValidationError: If any value is not int or float, or if non-array
+            input is nested.
+    """
+    try:
+        a = np.asarray(values)
+    except (TypeError, ValueError) as e:
+        raise ValidationError("values must be int or float") from e
+    if a.dtype.kind == "O":
+        return None
+    if a.dtype.kind not in "biuf":
+        raise ValidationError("values must be int or float")
+    if not isinstance(values, np.ndarray) and a.ndim != 1:
+        raise ValidationError("values must be a flat sequence of numbers")
+    return a.astype(np.float64, copy=False).ravel()
+
+
+#: Largest batch for which `RollingStats.bulk_update` uses a compiled Welford
+#: loop. Below it NumPy's fixed per-call overhead dominates; above it the
+#: vectorized combine is both faster and more accurate.
+_KERNEL_MAX_SIZE = 1024
+
+
+def _welford_loop(arr, n0, m0, m20):
+    """Internal: fold a float64 array into ``(n, mean, m2)`` value by value.
+
+    Plain Python source for the numba kernel built by `_jit_welford`.
+    """
+    n = n0
+    mean = m0
+    m2 = m20
+    for i in range(arr.shape[0]):
+        x = arr[i]
+        n += 1
+        # 1 / n does not depend on mean, so the division stays off the
+        # loop-carried dependency chain and overlaps with earlier steps.
+        inv_n = 1.0 / n
+        d = x - mean
+        mean += d * inv_n
+        m2 += d * (x - mean)
+    return n, mean, m2
+
+
+@lru_cache(maxsize=None)
+def _jit_welford() -> Optional[Callable[..., Tuple[int, float, float]]]:
+    """Internal: numba-compiled `_welford_loop`, or None without numba.
+
+    numba is imported on first use so that importing this module stays cheap.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_welford_loop)
+
+
+#: Minimum batch size for which `RollingStats.bulk_update` splits work
+#: across threads.
+_PARALLEL_THRESHOLD = 1_000_000
+
+_Moments = Tuple[int, float, float]
+
+
+def _batch_moments(a: np.ndarray) -> _Moments:
+    """Internal: ``(n, mean, m2)`` of a float64 array, computed with NumPy."""
+    nb = a.size
+    if nb == 0:
+        return 0, 0.0, 0.0
+    mb = float(a.mean())
+    return nb, mb, float(((a - mb) ** 2).sum())
+
+
+def _combine(left: _Moments, right: _Moments) -> _Moments:
+    """Internal: merge two ``(n, mean, m2)`` summaries (Chan et al.)."""
+    na, ma, m2a = left
+    nb, mb, m2b = right
+    n = na + nb
+    if n == 0:
+        return 0, 0.0, 0.0
+    delta = mb - ma
+    return (
+        n,
+        ma + delta * nb / n,
+        m2a + m2b + delta * delta * na * nb / n,
+    )
+
+
+def _usable_cpus() -> int:
+    """Internal: number of CPUs this process may run on.
+
+    Honours CPU affinity (e.g. ``taskset`` or container cpusets) where the
+    platform exposes it, unlike `os.cpu_count`.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - macOS / Windows
+        return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=None)
+def _thread_pool() -> ThreadPoolExecutor:
+    """Internal: shared worker pool for `_parallel_welford`, created once."""
+    return ThreadPoolExecutor(max_workers=_usable_cpus())
+
+
+def _parallel_welford(a: np.ndarray, workers: Optional[int] = None) -> _Moments:
+    """Internal: ``(n, mean, m2)`` of a large array using a thread pool.
+
+    The array is split into one slice per worker; NumPy releases the GIL
+    inside its reductions, so the slices are summarized concurrently and
+    then merged with `_combine`. With a single usable CPU this is just
+    `_batch_moments`.
+    """
+    workers = workers or _usable_cpus()
+    if workers == 1:
+        return _batch_moments(a)
+    parts = _thread_pool().map(_batch_moments, np.array_split(a, workers))
+    return reduce(_combine, parts)
+
+
+@dataclass(slots=True)
 class RollingStats:
     """Online mean and variance using Welford’s algorithm.
 
@@ -53,6 +196,14 @@ class RollingStats:
         n (int): Count of observations.
         _mean (float): Internal running mean.
         _m2 (float): Sum of squares of differences from the current mean.
+        _dirty (bool): Whether the cached variance must be recomputed.
+        _cached_var (float): Variance as of the last read.
+
+    Note:
+        Set ``n``/``_mean``/``_m2`` through the constructor, `update` or
+        `bulk_update` only. Assigning them directly after construction is
+        unsupported: it bypasses the dirty flag, so `variance` and `std`
+        keep returning the previously cached value.
 
     Example:
         >>> rs = RollingStats()
@@ -67,6 +218,8 @@ class RollingStats:
     n: int = 0
     _mean: float = 0.0
     _m2: float = 0.0
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _cached_var: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def update(self, x: float) -> None:
         """Update the running stats with a new value.
@@ -77,12 +230,23 @@ class RollingStats:
         Raises:
             ValidationError: If x is not a real finite number.
         """
-        # Basic validation (expand as needed)
-        if not isinstance(x, (int, float)):
-            raise ValidationError("x must be int or float")
-
+        # The subtraction rejects non-numeric input; the type check on its
+        # result rejects complex numbers, arrays and other non-real values.
+        try:
+            delta = x - self._mean
+        except TypeError:
+            raise ValidationError("x must be int or float") from None
+        if type(delta) is not float and type(delta) is not int:
+            if isinstance(x, (np.integer, np.floating)):
+                # NumPy scalars are ingested as Python floats, as
+                # `bulk_update` does.
+                x = float(x)
+                delta = x - self._mean
+            elif not isinstance(delta, (int, float)):
+                raise ValidationError("x must be int or float")
+
+        self._dirty = True
         self.n += 1
-        delta = x - self._mean
         self._mean += delta / self.n
         delta2 = x - self._mean
         self._m2 += delta * delta2
@@ -90,17 +254,105 @@ class RollingStats:
     def bulk_update(self, values: Iterable[float]) -> None:
         """Update stats with a stream of values.
 
+        Sized inputs (lists, tuples, NumPy arrays) are summarized in one
+        vectorized pass and folded into the running state with Chan's
+        parallel combine; other iterables, and sized inputs NumPy can only
+        hold as objects (sets, dict views, ints beyond int64), are streamed
+        through `update`.
+        Batches of at least 1,000,000 values are split across a shared
+        thread pool sized to the usable CPUs.
+        Batches of at most 1024 values run through a compiled Welford loop
+        instead: the Cython ``_welford`` extension if it is built, otherwise
+        a numba JIT kernel when numba is installed (imported and compiled
+        on the first such call).
+
         Args:
             values (Iterable[float]): Values to ingest.
 
+        Raises:
+            ValidationError: If any value is not numeric.
+
         Example:
             >>> rs = RollingStats()
             >>> rs.bulk_update([1, 2, 3, 4])
             >>> rs.n, rs.mean
             (4, 2.5)
+
+            The threaded and compiled paths agree with the NumPy combine
+            (kernels that are not installed are skipped):
+
+            >>> a = np.linspace(-3.0, 7.0, 1001) ** 2
+            >>> start = (5, 1.0, 2.0)
+            >>> ref = _combine(start, _batch_moments(a))
+            >>> results = [_combine(start, _parallel_welford(a, workers=4))]
+            >>> kernels = [k for k in (_c_welford, _jit_welford()) if k]
+            >>> results += [k(a, *start) for k in kernels]
+            >>> all(np.allclose(r, ref, rtol=1e-12) for r in results)
+            True
+        """
+        if not hasattr(values, "__len__"):
+            for v in values:
+                self.update(v)
+            return
+
+        a = _as_float_array(values)
+        if a is None:
+            for v in values:
+                self.update(v)
+            return
+        nb = a.size
+        if nb == 0:
+            return
+        self._dirty = True
+        state = (self.n, self._mean, self._m2)
+        if nb >= _PARALLEL_THRESHOLD:
+            self.n, self._mean, self._m2 = _combine(state, _parallel_welford(a))
+            return
+        if nb <= _KERNEL_MAX_SIZE:
+            kernel = _c_welford or _jit_welford()
+            if kernel is not None:
+                n, mean, m2 = kernel(
+                    np.ascontiguousarray(a), self.n, self._mean, self._m2
+                )
+                self.n, self._mean, self._m2 = int(n), float(mean), float(m2)
+                return
+
+        self.n, self._mean, self._m2 = _combine(state, _batch_moments(a))
+
+    @classmethod
+    def from_array(cls, values: Iterable[float]) -> "RollingStats":
+        """Build stats for an in-memory batch with the two-pass algorithm.
+
+        The mean and the sum of squared deviations are computed with NumPy
+        (the latter as a BLAS dot product), which is faster than any
+        streaming update when all values are already available.
+
+        Args:
+            values (Iterable[float]): Values to summarize.
+
+        Returns:
+            RollingStats: Stats equivalent to ingesting ``values`` one by one.
+
+        Raises:
+            ValidationError: If any value is not numeric.
+
+        Example:
+            >>> rs = RollingStats.from_array([1, 2, 3, 4])
+            >>> rs.n, rs.mean, round(rs.variance, 4)
+            (4, 2.5, 1.6667)
         """
-        for v in values:
-            self.update(v)
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        a = _as_float_array(values)
+        if a is None:
+            rs = cls()
+            rs.bulk_update(values)
+            return rs
+        if a.size == 0:
+            return cls()
+        m = float(a.mean())
+        d = a - m
+        return cls(n=a.size, _mean=m, _m2=float(np.dot(d, d)))
 
     @property
     def mean(self) -> float:
@@ -109,10 +361,16 @@ class RollingStats:
 
     @property
     def variance(self) -> float:
-        """float: Sample variance (0.0 if fewer than 2 observations)."""
-        if self.n < 2:
-            return 0.0
-        return self._m2 / (self.n - 1)
+        """float: Sample variance (0.0 if fewer than 2 observations).
+
+        The value is cached until the next `update`/`bulk_update`.
+        """
+        if not self._dirty:
+            return self._cached_var
+        v = self._m2 / (self.n - 1) if self.n >= 2 else 0.0
+        self._cached_var = v
+        self._dirty = False
+        return v
 
     @property
     def std(self) -> float:
@@ -120,49 +378,192 @@ class RollingStats:
         return sqrt(self.variance)
 
 
+# Specialized TextCleaner implementations, one per (lowercase, collapse_spaces)
+# combination. split() already drops leading/trailing whitespace, so the
+# collapsing variants need no separate strip(); empty strings (common for
+# blank fields) skip split/join altogether. str.lower() already takes a fast
+# path for ASCII text, so no bytes.translate variant is used.
+
+
+def _clean_lower_collapse(s: str) -> str:
+    """Internal: collapse whitespace and lowercase."""
+    if not isinstance(s, str):
+        raise ValidationError("s must be a string")
+    if not s:
+        return ""
+    return " ".join(s.split()).lower()
+
+
+def _clean_collapse(s: str) -> str:
+    """Internal: collapse whitespace."""
+    if not isinstance(s, str):
+        raise ValidationError("s must be a string")
+    if not s:
+        return ""
+    return " ".join(s.split())
+
+
+def _clean_lower(s: str) -> str:
+    """Internal: strip and lowercase."""
+    if not isinstance(s, str):
+        raise ValidationError("s must be a string")
+    return s.strip().lower()
+
+
+def _clean_strip(s: str) -> str:
+    """Internal: strip only."""
+    if not isinstance(s, str):
+        raise ValidationError("s must be a string")
+    return s.strip()
+
+
+_CLEAN_IMPLS: Dict[Tuple[bool, bool], Callable[[str], str]] = {
+    (True, True): _clean_lower_collapse,
+    (False, True): _clean_collapse,
+    (True, False): _clean_lower,
+    (False, False): _clean_strip,
+}
+
+
+#: Longer strings are cleaned directly instead of being memoized, so a
+#: memoizing cleaner never pins large documents in memory.
+_CLEAN_CACHE_MAX_LEN = 256
+
+
+def _memoized_cleaner(
+    impl: Callable[[str], str], maxsize: int
+) -> Callable[[str], str]:
+    """Internal: wrap a clean implementation in its own LRU cache.
+
+    Validation runs before the cache lookup, so unhashable non-strings
+    still raise `ValidationError`. The wrapper exposes ``cache_clear`` and
+    ``cache_info`` from `functools.lru_cache`.
+    """
+    cached = lru_cache(maxsize=maxsize)(impl)
+
+    @wraps(impl)
+    def clean(s: str) -> str:
+        if not isinstance(s, str):
+            raise ValidationError("s must be a string")
+        if len(s) > _CLEAN_CACHE_MAX_LEN:
+            return impl(s)
+        return cached(s)
+
+    clean.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    clean.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    return clean
+
+
 class TextCleaner:
     """Simple text normalization helpers.
 
     Methods here are intentionally straightforward to demo doc rendering.
+    Each instance binds `clean` to an implementation specialized for its
+    flags, so calls do not re-check ``lowercase``/``collapse_spaces``;
+    assigning either flag rebinds it.
+
+    Pass ``memoize=N`` to keep an LRU cache of up to N results for strings
+    of at most 256 characters, which pays off when the same short strings
+    (tags, category names, headers) recur. It is off by default because
+    the cache bookkeeping makes every miss slower. Changing a flag starts a
+    fresh cache; `cache_clear` empties it.
 
     Example:
         >>> cleaner = TextCleaner()
         >>> cleaner.clean("  Hello,   WORLD!!  ")
         'hello, world!!'
+
+        >>> tags = TextCleaner(memoize=1024)
+        >>> [tags.clean(t) for t in ["  Red ", "  Red ", "BLUE"]]
+        ['red', 'red', 'blue']
+        >>> tags.clean.cache_info().hits
+        1
     """
 
-    def __init__(self, lowercase: bool = True, collapse_spaces: bool = True):
+    def __init__(
+        self,
+        lowercase: bool = True,
+        collapse_spaces: bool = True,
+        memoize: Optional[int] = None,
+    ):
         """Initialize the cleaner.
 
         Args:
             lowercase (bool): If True, convert text to lowercase.
             collapse_spaces (bool): If True, normalize multiple spaces to one.
+            memoize (Optional[int]): If set, memoize up to this many results
+                of `clean` (LRU). None disables memoization.
         """
-        self.lowercase = lowercase
-        self.collapse_spaces = collapse_spaces
+        self._lowercase = bool(lowercase)
+        self._collapse_spaces = bool(collapse_spaces)
+        self._memoize = memoize
+        self.clean = self._pick_impl()
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Pickle the settings only; the bound `clean` is rebuilt on load."""
+        state = self.__dict__.copy()
+        state.pop("clean", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore the settings and rebind the specialized `clean`."""
+        self.__dict__.update(state)
+        self.clean = self._pick_impl()
+
+    @property
+    def lowercase(self) -> bool:
+        """bool: Whether text is converted to lowercase."""
+        return self._lowercase
+
+    @lowercase.setter
+    def lowercase(self, value: bool) -> None:
+        self._lowercase = bool(value)
+        self.clean = self._pick_impl()
+
+    @property
+    def collapse_spaces(self) -> bool:
+        """bool: Whether runs of whitespace are normalized to one space."""
+        return self._collapse_spaces
+
+    @collapse_spaces.setter
+    def collapse_spaces(self, value: bool) -> None:
+        self._collapse_spaces = bool(value)
+        self.clean = self._pick_impl()
+
+    def cache_clear(self) -> None:
+        """Drop memoized results (no-op unless created with ``memoize``)."""
+        clear = getattr(self.clean, "cache_clear", None)
+        if clear is not None:
+            clear()
+
+    def _pick_impl(self) -> Callable[[str], str]:
+        """Internal: return the clean function for the current settings."""
+        impl = _CLEAN_IMPLS[(self._lowercase, self._collapse_spaces)]
+        if self._memoize is None:
+            return impl
+        return _memoized_cleaner(impl, self._memoize)
 
     def clean(self, s: str) -> str:
         """Clean and normalize input text.
 
+        Instances shadow this method with the specialized implementation
+        chosen in `__init__`; it is kept for documentation and for calls
+        through the class.
+
         Args:
             s (str): Raw input text.
 
         Returns:
             str: Cleaned text.
 
+        Raises:
+            ValidationError: If s is not a string.
+
         Example:
             >>> TextCleaner(lowercase=False).clean("Hi   THERE")
             'Hi THERE'
         """
-        if not isinstance(s, str):
-            raise ValidationError("s must be a string")
-
-        out = s.strip()
-        if self.collapse_spaces:
-            out = " ".join(out.split())
-        if self.lowercase:
-            out = out.lower()
-        return out
+        return _CLEAN_IMPLS[(self._lowercase, self._collapse_spaces)](s)
 
 
 class Calculator:
@@ -208,23 +609,40 @@ class Calculator:
     def mean(values: Iterable[float]) -> float:
         """Compute arithmetic mean.
 
+        The sum is accumulated with `math.fsum`, so it is correctly rounded
+        even over long inputs. Infinite or overflowing inputs fall back to a
+        plain float sum, giving ``nan``/``inf`` as ordinary arithmetic would.
+        Any real number `math.fsum` can convert is accepted, including
+        `decimal.Decimal` and `fractions.Fraction` (converted to float).
+
         Args:
             values (Iterable[float]): Numeric values.
 
         Returns:
             float: Mean (0.0 if empty).
 
+        Raises:
+            ValidationError: If any value is not numeric.
+
         Example:
             >>> Calculator.mean([2, 4, 6])
             4.0
+            >>> Calculator.mean([float("inf"), float("-inf")])
+            nan
+            >>> Calculator.mean([1e308, 1e308])
+            inf
         """
-        total = 0.0
-        count = 0
-        for v in values:
-            Calculator._validate_numbers(v)
-            total += v
-            count += 1
-        return total / count if count else 0.0
+        lst = list(values)
+        if not lst:
+            return 0.0
+        try:
+            total = fsum(lst)
+        except TypeError as e:
+            raise ValidationError("all inputs must be int or float") from e
+        except (ValueError, OverflowError):
+            # inf - inf or an overflowing partial sum; fsum refuses both.
+            total = sum(float(v) for v in lst)
+        return total / len(lst)
 
     @staticmethod
     def _validate_numbers(*nums: float) -> None:
@@ -234,7 +652,12 @@ class Calculator:
                 raise ValidationError("all inputs must be int or float")
 
 
-@dataclass
+#: Values per chunk when `DataPipeline.ingest_numbers` streams an unsized
+#: iterable without caching.
+_STREAM_CHUNK_SIZE = 65_536
+
+
+@dataclass(slots=True)
 class DataPipeline:
     """A tiny orchestration helper for analytics.
 
@@ -243,21 +666,46 @@ class DataPipeline:
     Attributes:
         cleaner (TextCleaner): Text normalization component.
         stats (RollingStats): Streaming stats component.
-        cache (List[float]): Optionally accumulated numeric features.
+        cache (array.array | collections.deque): Optionally accumulated
+            numeric features. Stored as packed doubles (typecode ``'d'``) by
+            default; use ``list(cache)`` for a plain list. Any other
+            container with ``extend`` and ``clear`` (e.g. a list) may be
+            passed in as well.
+        cache_enabled (bool): If False, `ingest_numbers` only updates `stats`
+            and never grows `cache`.
+        cache_maxlen (Optional[int]): If set, `cache` is a
+            ``deque(maxlen=cache_maxlen)`` holding only the most recent values.
 
     Example:
         >>> p = DataPipeline()
         >>> p.ingest_texts(["  Hello  ", "WORLD   "])
+        ['hello', 'world']
         >>> p.cleaner.clean("  EXTRA   Text ")
         'extra text'
         >>> p.ingest_numbers([10, 20, 30])
         >>> round(p.stats.mean, 2)
         20.0
+        >>> p.cache.tolist()
+        [10.0, 20.0, 30.0]
+
+        >>> recent = DataPipeline(cache_maxlen=2)
+        >>> recent.ingest_numbers([1, 2, 3])
+        >>> list(recent.cache), recent.stats.n
+        ([2.0, 3.0], 3)
     """
 
     cleaner: TextCleaner = field(default_factory=TextCleaner)
     stats: RollingStats = field(default_factory=RollingStats)
-    cache: List[float] = field(default_factory=list)
+    cache: Union[array.array, Deque[float]] = field(
+        default_factory=lambda: array.array("d")
+    )
+    cache_enabled: bool = True
+    cache_maxlen: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Switch to a bounded deque cache when `cache_maxlen` is set."""
+        if self.cache_maxlen is not None:
+            self.cache = deque(self.cache, maxlen=self.cache_maxlen)
 
     def ingest_texts(self, texts: Iterable[str]) -> List[str]:
         """Clean a stream of texts and return cleaned copies.
@@ -271,28 +719,59 @@ class DataPipeline:
         Raises:
             ValidationError: If any item is not a string.
         """
-        cleaned: List[str] = []
-        for t in texts:
-            cleaned.append(self.cleaner.clean(t))
-        return cleaned
+        clean = self.cleaner.clean
+        return [clean(t) for t in texts]
 
     def ingest_numbers(self, xs: Iterable[float]) -> None:
         """Update rolling stats and keep an optional cache.
 
+        With the cache enabled the call is all-or-nothing: invalid input
+        raises before stats or cache change. With ``cache_enabled=False``
+        unsized iterables are consumed in fixed-size chunks, keeping memory
+        bounded; chunks before an invalid item stay ingested.
+
         Args:
             xs (Iterable[float]): Numbers to ingest.
 
         Raises:
             ValidationError: If any item is not numeric.
         """
-        for x in xs:
-            self.stats.update(x)
-            self.cache.append(float(x))
+        if not self.cache_enabled:
+            if hasattr(xs, "__len__"):
+                self.stats.bulk_update(xs)
+                return
+            it = iter(xs)
+            for chunk in iter(lambda: list(islice(it, _STREAM_CHUNK_SIZE)), []):
+                self.stats.bulk_update(chunk)
+            return
+
+        if not hasattr(xs, "__len__"):
+            xs = list(xs)
+        arr = _as_float_array(xs)
+        if arr is None:
+            # Validate through the scalar path on scratch stats first, so a
+            # bad item leaves both stats and cache untouched.
+            RollingStats().bulk_update(xs)
+            arr = np.array(list(xs), dtype=np.float64)
+        self.stats.bulk_update(arr)
+        if isinstance(self.cache, array.array) and self.cache.typecode == "d":
+            self.cache.frombytes(arr.tobytes())
+        else:
+            # deque, list or any other extendable cache; a bounded deque
+            # would evict everything but its last maxlen values anyway.
+            maxlen = getattr(self.cache, "maxlen", None)
+            tail = arr[-maxlen:] if maxlen else arr
+            self.cache.extend(tail.tolist())
 
     def reset(self) -> None:
         """Reset the pipeline state (stats + cache)."""
         self.stats = RollingStats()
-        self.cache.clear()
+        # Clear in place so existing references see the reset; array.array
+        # has no clear() and deque does not support slice deletion.
+        if isinstance(self.cache, array.array):
+            del self.cache[:]
+        else:
+            self.cache.clear()
 
 
 def demo() -> None:
@@ -0,0 +1,15 @@
+"""Build the optional Cython Welford kernel used by ``analytics.py``.
+
+Usage::
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="cas-ads-analytics",
+    ext_modules=cythonize("_welford.pyx"),
+    zip_safe=False,
+)
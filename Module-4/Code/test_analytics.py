@@ -0,0 +1,166 @@
+import math
+import pickle
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from analytics import Calculator, DataPipeline, RollingStats, TextCleaner, ValidationError
+
+
+def state(rs):
+    return rs.n, rs.mean, rs.variance
+
+
+def test_update_rejects_non_numbers():
+    rs = RollingStats()
+    rs.update(1.0)
+    for bad in ("a", None, 1j, np.array([1.0, 2.0])):
+        with pytest.raises(ValidationError):
+            rs.update(bad)
+    assert state(rs) == (1, 1.0, 0.0)
+
+
+def test_update_with_int_mean():
+    rs = RollingStats(n=1, _mean=5, _m2=0)
+    rs.update(7)
+    assert rs.n == 2
+    assert rs.mean == 6.0
+    assert rs.variance == 2.0
+
+
+def test_update_numpy_scalar_matches_bulk():
+    a, b = RollingStats(), RollingStats()
+    a.update(np.float32(0.1))
+    b.bulk_update(np.array([0.1], dtype=np.float32))
+    assert type(a.mean) is float
+    assert state(a) == state(b)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [list, set, lambda xs: (x for x in xs), lambda xs: {x: None for x in xs}.keys()],
+)
+def test_bulk_update_matches_update(make):
+    xs = [1.0, 2.5, 4.0, 8.0, -3.0]
+    a, b = RollingStats(), RollingStats()
+    for x in xs:
+        a.update(x)
+    b.bulk_update(make(xs))
+    assert b.n == a.n
+    assert math.isclose(b.mean, a.mean)
+    assert math.isclose(b.variance, a.variance)
+
+
+def test_bulk_update_big_ints():
+    rs = RollingStats()
+    rs.bulk_update([10**30, 10**30])
+    assert rs.n == 2
+    assert rs.mean == 1e30
+
+
+@pytest.mark.parametrize("size", [10, 5000])
+def test_bulk_update_matches_numpy(size):
+    xs = np.linspace(-3, 7, size) ** 2
+    rs = RollingStats()
+    rs.bulk_update(xs)
+    assert rs.n == size
+    assert math.isclose(rs.mean, xs.mean(), rel_tol=1e-12)
+    assert math.isclose(rs.variance, xs.var(ddof=1), rel_tol=1e-12)
+
+
+@pytest.mark.parametrize("bad", [[[1.0, 2.0]], ["a", "b"], np.array(["1"])])
+def test_bulk_update_rejects_arrays_and_keeps_state(bad):
+    rs = RollingStats()
+    rs.bulk_update([1.0, 3.0])
+    with pytest.raises(ValidationError):
+        rs.bulk_update(bad)
+    assert state(rs) == (2, 2.0, 2.0)
+
+
+def test_calculator_mean():
+    assert Calculator.mean([]) == 0.0
+    assert Calculator.mean([1, 2, 3]) == 2.0
+    assert math.isnan(Calculator.mean([1.0, float("nan")]))
+    assert Calculator.mean([1.0, float("inf")]) == float("inf")
+    assert Calculator.mean([Decimal("Infinity"), 1]) == float("inf")
+    with pytest.raises(ValidationError):
+        Calculator.mean([1, "a"])
+
+
+def test_ingest_numbers_is_atomic():
+    p = DataPipeline()
+    p.ingest_numbers([5.0])
+    with pytest.raises(ValidationError):
+        p.ingest_numbers([1, 2, None])
+    assert p.stats.n == 1
+    assert p.cache.tolist() == [5.0]
+
+
+def test_ingest_numbers_without_cache():
+    p = DataPipeline(cache_enabled=False)
+    p.ingest_numbers(float(x) for x in range(200_000))
+    p.ingest_numbers([1.0, 2.0])
+    assert p.stats.n == 200_002
+    assert len(p.cache) == 0
+
+
+def test_cache_maxlen_and_reset():
+    p = DataPipeline(cache_maxlen=3)
+    p.ingest_numbers([1])
+    p.ingest_numbers(range(10))
+    assert list(p.cache) == [7.0, 8.0, 9.0]
+    cache = p.cache
+    p.reset()
+    assert p.cache is cache
+    assert len(cache) == 0
+    assert p.stats.n == 0
+
+
+def test_list_cache():
+    p = DataPipeline(cache=[0.0])
+    p.ingest_numbers([1, 2])
+    assert p.cache == [0.0, 1.0, 2.0]
+    p.reset()
+    assert p.cache == []
+
+
+def test_pickle_round_trip():
+    tc = pickle.loads(pickle.dumps(TextCleaner(memoize=16)))
+    assert tc.clean("  A  B ") == "a b"
+    p = DataPipeline(cleaner=TextCleaner(lowercase=False))
+    p.ingest_numbers([1.0, 2.0])
+    q = pickle.loads(pickle.dumps(p))
+    assert q.cache.tolist() == [1.0, 2.0]
+    assert q.stats == p.stats
+    assert q.cleaner.clean(" Hi ") == "Hi"
+
+
+def test_text_cleaner_cache_clear():
+    tc = TextCleaner(memoize=16)
+    tc.clean("x")
+    tc.clean("x")
+    assert tc.clean.cache_info().hits == 1
+    tc.cache_clear()
+    assert tc.clean.cache_info().currsize == 0
+    TextCleaner().cache_clear()
+
+
+def test_text_cleaner_flags_rebind():
+    tc = TextCleaner()
+    assert tc.clean("  Hello   World ") == "hello world"
+    tc.lowercase = False
+    assert tc.clean("  Hello   World ") == "Hello World"
+    tc.collapse_spaces = False
+    assert tc.clean("  Hello   World ") == "Hello   World"
+
+
+def test_from_array_matches_bulk_update():
+    xs = np.linspace(-3, 7, 5000) ** 2
+    a = RollingStats.from_array(xs)
+    b = RollingStats()
+    b.bulk_update(xs)
+    assert a.n == b.n
+    assert math.isclose(a.mean, b.mean, rel_tol=1e-12)
+    assert math.isclose(a.variance, b.variance, rel_tol=1e-12)
+    assert state(RollingStats.from_array([])) == (0, 0.0, 0.0)
+    assert RollingStats.from_array(x for x in {1, 2, 3}).n == 3